@@ -1,12 +1,75 @@
 import requests
-from bs4 import BeautifulSoup
-import json
-import time
-import random
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+import orjson
+from pathlib import Path
+from urllib.parse import urlparse
 import re
+import threading
+import logging
+from cache import LRUCache
+from models import Deal
+from parsing import ParserError, css, parse_html, select_one, text_of
+from ratelimit import TokenBucket
+
+logger = logging.getLogger(__name__)
+
+_NON_NUMERIC = re.compile(r'[^\d.]')
+_FIRST_INT = re.compile(r'(\d+)')
+
 
 class AmazonDealsScraper:
-    def __init__(self):
+    MAX_WORKERS = 8  # Concurrent product page fetches in scrape_deals
+    MAX_IN_FLIGHT = 8  # Upper bound on simultaneous requests from one scraper
+    TIMEOUT = 15  # Request timeout in seconds
+    RATE_LIMIT = 0.5  # Requests per second allowed per host
+    RATE_BURST = 2  # Requests per host allowed back-to-back before throttling
+    DETAIL_CACHE_SIZE = 4096  # Product pages remembered across scrape runs
+    DETAIL_CACHE_TTL = 15 * 60  # Seconds before a cached product page is re-fetched
+    
+    # CSS selectors compiled to XPath once, at class definition
+    _SEL_DEAL_LINK = css('a[data-testid="product-card-link"]')
+    _SEL_DEAL_LINK_FALLBACKS = (
+        css('a[href*="/dp/"]'),
+        css('a.a-link-normal[href*="/dp/"]'),
+        css('div[data-deal-id] a[href*="/dp/"]'),
+    )
+    _SEL_TITLE = css('#productTitle')
+    _SEL_BRAND = css('#bylineInfo')
+    _SEL_BREADCRUMBS = (
+        css('#wayfinding-breadcrumbs_container ul li a'),
+        css('#wayfinding-breadcrumbs_feature_div ul li a'),
+        css('div[id*="breadcrumb"] a'),
+    )
+    _SEL_ORIG_PRICE = css('span.a-price[data-a-strike="true"] .a-offscreen')
+    _SEL_DISCOUNT = css('span.savingsPercentage')
+    _SEL_AOK_OFFSCREEN = css('.aok-offscreen')
+    _SEL_ACTIVE_PRICE = css('.a-price:not([data-a-strike])')
+    _SEL_OFFSCREEN_PRICE = css('.a-price:not([data-a-strike="true"]) .a-offscreen')
+    _SEL_EXPIRY = (
+        css('span#deal-end-time'),
+        css('span[id*="timer"]'),
+        css('div[data-dealcountdownstring]'),
+        css('span[data-a-expiration-time]'),
+        css('#dealExpiry'),
+    )
+    _SEL_DESCRIPTION = (
+        css('#feature-bullets ul li'),  # Primary selector
+        css('div.a-expander-content.a-expander-partial-collapse-content ul li'),  # Fallback for "About this item"
+        css('div[class*="a-expander-content"] ul li'),  # Additional fallback
+    )
+    _SEL_IMAGE = css('#imgTagWrapperId img')
+    
+    def __init__(self, timeout=TIMEOUT, max_in_flight=MAX_IN_FLIGHT):
+        self.timeout = timeout
+        # Caps concurrent requests no matter how many threads share this scraper
+        self._in_flight = threading.BoundedSemaphore(max_in_flight)
+        # Politeness is enforced per host, so parsing and other hosts never wait on it
+        self._rate_limiter = TokenBucket(self.RATE_LIMIT, self.RATE_BURST)
+        # Deals keyed by product URL, so repeat scrapes skip the fetch and parse
+        self._detail_cache = LRUCache(self.DETAIL_CACHE_SIZE, self.DETAIL_CACHE_TTL)
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
@@ -17,55 +80,62 @@ class AmazonDealsScraper:
         }
         self.session = requests.Session()
         self.session.headers.update(self.headers)
+        # Pool keep-alive connections so concurrent workers reuse them,
+        # and let urllib3 retry transient failures with backoff
+        adapter = HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=32,
+            max_retries=Retry(total=3, backoff_factor=0.5,
+                              status_forcelist=(429, 500, 502, 503, 504))
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
     
     def get_page(self, url):
-        """Fetch a page with retry logic"""
-        max_retries = 3
-        for attempt in range(max_retries):
-            try:
-                response = self.session.get(url, timeout=15)
-                response.raise_for_status()
-                time.sleep(random.uniform(2, 4))
-                return response.text
-            except requests.RequestException as e:
-                print(f"Attempt {attempt + 1} failed: {e}")
-                if attempt < max_retries - 1:
-                    time.sleep(5)
-                else:
-                    return None
+        """Fetch a page (retries are handled by the session's adapter)"""
+        self._rate_limiter.acquire(urlparse(url).netloc)
+        try:
+            with self._in_flight:
+                response = self.session.get(url, timeout=self.timeout)
+            response.raise_for_status()
+        except requests.RequestException as e:
+            logger.warning("Failed to fetch %s: %s", url, e)
+            return None
+        # Raw bytes let lxml detect the encoding itself instead of requests' chardet
+        return response.content
     
     def extract_deal_links(self, deals_page_url):
         """Extract all deal links from the deals page"""
-        print(f"Fetching deals page: {deals_page_url}")
+        deal_links = list(self.iter_deal_links(deals_page_url))
+        logger.info("Found %d unique deals", len(deal_links))
+        return deal_links
+    
+    def iter_deal_links(self, deals_page_url):
+        """Yield unique deal links from the deals page as they are parsed"""
+        logger.info("Fetching deals page: %s", deals_page_url)
         html = self.get_page(deals_page_url)
         
         if not html:
-            print("Failed to fetch deals page")
-            return []
-        
-        soup = BeautifulSoup(html, 'html.parser')
-        deal_links = []
+            logger.warning("Failed to fetch deals page")
+            return
         
-        # Primary selector
-        primary_selector = 'a[data-testid="product-card-link"]'
-        
-        # Fallback selectors
-        fallback_selectors = [
-            'a[href*="/dp/"]',
-            'a.a-link-normal[href*="/dp/"]',
-            'div[data-deal-id] a[href*="/dp/"]',
-        ]
+        try:
+            tree = parse_html(html)
+        except ParserError as e:
+            logger.warning("Failed to parse deals page: %s", e)
+            return
         
-        links = soup.select(primary_selector)
+        links = self._SEL_DEAL_LINK(tree)
         
         if not links:
-            print("Primary selector found no links, trying fallbacks...")
-            for selector in fallback_selectors:
-                links = soup.select(selector)
+            logger.debug("Primary selector found no links, trying fallbacks...")
+            for selector in self._SEL_DEAL_LINK_FALLBACKS:
+                links = selector(tree)
                 if links:
-                    print(f"Found links using fallback selector: {selector}")
+                    logger.debug("Found links using fallback selector: %s", selector.css)
                     break
         
+        seen = set()
         for link in links:
             href = link.get('href')
             if href:
@@ -76,11 +146,10 @@ class AmazonDealsScraper:
                 
                 if '/dp/' in href:
                     clean_url = href.split('?')[0]
-                    deal_links.append(clean_url)
-        
-        deal_links = list(dict.fromkeys(deal_links))
-        print(f"Found {len(deal_links)} unique deals")
-        return deal_links
+                    # Dedupe inline, keeping first-seen order
+                    if clean_url not in seen:
+                        seen.add(clean_url)
+                        yield clean_url
     
     def extract_price_numeric(self, price_str):
         """Extract numeric value from price string"""
@@ -88,227 +157,205 @@ class AmazonDealsScraper:
             return None
         try:
             # Remove currency, commas, spaces
-            numeric = re.sub(r'[^\d.]', '', price_str)
+            numeric = _NON_NUMERIC.sub('', price_str)
             return float(numeric)
         except:
             return None
     
     def extract_deal_details(self, product_url):
-        """Extract details from a single product/deal page"""
-        print(f"\n{'='*60}")
-        print(f"Scraping: {product_url}")
-        print(f"{'='*60}")
+        """Extract details from a single product/deal page, or None if it is not a deal"""
+        cached = self._detail_cache.get(product_url)
+        if cached is not None:
+            logger.debug("Cache hit: %s", product_url)
+            return cached
+        
+        logger.debug("Scraping: %s", product_url)
         
         html = self.get_page(product_url)
         
         if not html:
             return None
         
-        soup = BeautifulSoup(html, 'html.parser')
+        try:
+            tree = parse_html(html)
+        except ParserError as e:
+            logger.warning("Failed to parse %s: %s", product_url, e)
+            return None
         
-        deal_data = {
-            "url": product_url,
-            "title": "Not found",
-            "brand": "Not found",
-            "category": "Not found",
-            "original_price": "Not found",
-            "discounted_price": "Not found",
-            "discount_percentage": "Not found",
-            "expiry_date": "Not found",
-            "description": "Not found",
-            "product_image": "Not found"
-        }
+        deal_data = Deal(url=product_url)
         
         # Extract Title
-        title = soup.select_one('#productTitle')
-        if title:
-            deal_data["title"] = title.get_text(strip=True)
-            print(f"✓ Title: {deal_data['title'][:60]}...")
+        title = select_one(tree, self._SEL_TITLE)
+        if title is not None:
+            deal_data.title = text_of(title)
+            logger.debug("Title: %.60s", deal_data.title)
         
         # Extract Brand
-        brand = soup.select_one('#bylineInfo')
-        if brand:
-            brand_text = brand.get_text(strip=True)
+        brand = select_one(tree, self._SEL_BRAND)
+        if brand is not None:
+            brand_text = text_of(brand)
             brand_text = brand_text.replace('Visit the', '').replace('Brand:', '').replace('Store', '').strip()
-            deal_data["brand"] = brand_text
-            print(f"✓ Brand: {deal_data['brand']}")
+            deal_data.brand = brand_text
+            logger.debug("Brand: %s", deal_data.brand)
         
         # Extract Category
-        breadcrumb = soup.select('#wayfinding-breadcrumbs_container ul li a')
-        if not breadcrumb:
-            breadcrumb = soup.select('#wayfinding-breadcrumbs_feature_div ul li a')
-        if not breadcrumb:
-            breadcrumb = soup.select('div[id*="breadcrumb"] a')
+        breadcrumb = []
+        for selector in self._SEL_BREADCRUMBS:
+            breadcrumb = selector(tree)
+            if breadcrumb:
+                break
         
         if breadcrumb:
-            categories = [cat.get_text(strip=True) for cat in breadcrumb if cat.get_text(strip=True)]
+            categories = [text_of(cat) for cat in breadcrumb if text_of(cat)]
             if categories:
-                deal_data["category"] = ' > '.join(categories)
-                print(f"✓ Category: {deal_data['category']}")
+                deal_data.category = ' > '.join(categories)
+                logger.debug("Category: %s", deal_data.category)
         
         # Extract Original Price
-        original_price_elem = soup.select_one('span.a-price[data-a-strike="true"] .a-offscreen')
-        if original_price_elem:
-            deal_data["original_price"] = original_price_elem.get_text(strip=True)
-            print(f"✓ Original Price: {deal_data['original_price']}")
+        original_price_elem = select_one(tree, self._SEL_ORIG_PRICE)
+        if original_price_elem is not None:
+            deal_data.original_price = text_of(original_price_elem)
+            logger.debug("Original price: %s", deal_data.original_price)
         
         # Extract Discount Percentage
-        discount = soup.select_one('span.savingsPercentage')
-        if discount:
-            deal_data["discount_percentage"] = discount.get_text(strip=True)
-            print(f"✓ Discount: {deal_data['discount_percentage']}")
+        discount = select_one(tree, self._SEL_DISCOUNT)
+        if discount is not None:
+            deal_data.discount_percentage = text_of(discount)
+            logger.debug("Discount: %s", deal_data.discount_percentage)
         
         # Extract Discounted Price - MULTIPLE METHODS
-        print(f"\n--- Extracting Discounted Price ---")
-        
         # Method 1: .aok-offscreen with "savings" text
-        print(f"Method 1: Checking .aok-offscreen elements...")
-        aok_offscreens = soup.select('.aok-offscreen')
-        print(f"  Found {len(aok_offscreens)} .aok-offscreen elements")
+        aok_offscreens = self._SEL_AOK_OFFSCREEN(tree)
         
         for i, elem in enumerate(aok_offscreens):
-            text = elem.get_text(strip=True)
+            text = text_of(elem)
             if text and 'AED' in text and 'with' in text.lower() and 'savings' in text.lower():
                 price_part = text.split('with')[0].strip()
-                deal_data["discounted_price"] = price_part.replace('\xa0', ' ')
-                print(f"  ✓ FOUND via .aok-offscreen: {deal_data['discounted_price']}")
+                deal_data.discounted_price = price_part.replace('\xa0', ' ')
+                logger.debug("Discounted price via .aok-offscreen: %s", deal_data.discounted_price)
                 break
         
         # Method 2: Build from .a-price-whole and .a-price-fraction
-        if deal_data["discounted_price"] == "Not found":
-            print(f"Method 2: Building from price parts...")
-            price_symbol = soup.select_one('.a-price:not([data-a-strike]) .a-price-symbol')
-            price_whole = soup.select_one('.a-price:not([data-a-strike]) .a-price-whole')
-            price_fraction = soup.select_one('.a-price:not([data-a-strike]) .a-price-fraction')
-            
-            if price_whole:
-                symbol = price_symbol.get_text(strip=True) if price_symbol else "AED"
-                whole = price_whole.get_text(strip=True).replace(',', '').strip()
-                fraction = price_fraction.get_text(strip=True) if price_fraction else "00"
+        # One document walk finds the price containers; parts are read from inside them
+        if deal_data.discounted_price == "Not found":
+            for container in self._SEL_ACTIVE_PRICE(tree):
+                price_whole = container.find_class('a-price-whole')
+                if not price_whole:
+                    continue
+                price_symbol = container.find_class('a-price-symbol')
+                price_fraction = container.find_class('a-price-fraction')
+                
+                symbol = text_of(price_symbol[0]) if price_symbol else "AED"
+                whole = text_of(price_whole[0]).replace(',', '').strip()
+                fraction = text_of(price_fraction[0]) if price_fraction else "00"
                 
-                deal_data["discounted_price"] = f"{symbol} {whole}.{fraction}"
-                print(f"  ✓ BUILT from parts: {deal_data['discounted_price']}")
+                deal_data.discounted_price = f"{symbol} {whole}.{fraction}"
+                logger.debug("Discounted price built from parts: %s", deal_data.discounted_price)
+                break
         
         # Method 3: Try .a-offscreen from non-strike prices
-        if deal_data["discounted_price"] == "Not found":
-            print(f"Method 3: Checking .a-offscreen in non-strike prices...")
-            offscreen_prices = soup.select('.a-price:not([data-a-strike="true"]) .a-offscreen')
+        if deal_data.discounted_price == "Not found":
+            offscreen_prices = self._SEL_OFFSCREEN_PRICE(tree)
             for elem in offscreen_prices:
-                text = elem.get_text(strip=True)
+                text = text_of(elem)
                 if text and 'AED' in text and len(text) > 3:
-                    deal_data["discounted_price"] = text
-                    print(f"  ✓ FOUND in .a-offscreen: {deal_data['discounted_price']}")
+                    deal_data.discounted_price = text
+                    logger.debug("Discounted price via .a-offscreen: %s", deal_data.discounted_price)
                     break
         
         # Method 4: CALCULATE from original price and discount
-        if deal_data["discounted_price"] == "Not found":
-            print(f"Method 4: Attempting calculation...")
-            print(f"  Original: {deal_data['original_price']}")
-            print(f"  Discount: {deal_data['discount_percentage']}")
-            
-            if deal_data["original_price"] != "Not found" and deal_data["discount_percentage"] != "Not found":
+        if deal_data.discounted_price == "Not found":
+            if deal_data.original_price != "Not found" and deal_data.discount_percentage != "Not found":
                 try:
-                    original_val = self.extract_price_numeric(deal_data["original_price"])
-                    discount_match = re.search(r'(\d+)', deal_data["discount_percentage"])
+                    original_val = self.extract_price_numeric(deal_data.original_price)
+                    discount_match = _FIRST_INT.search(deal_data.discount_percentage)
                     
                     if original_val and discount_match:
                         discount_val = float(discount_match.group(1))
                         discounted_val = original_val * (1 - discount_val / 100)
-                        deal_data["discounted_price"] = f"AED {discounted_val:.2f}"
-                        print(f"  ✓ CALCULATED: {deal_data['discounted_price']}")
+                        deal_data.discounted_price = f"AED {discounted_val:.2f}"
+                        logger.debug("Discounted price calculated: %s", deal_data.discounted_price)
                     else:
-                        print(f"  ✗ Could not extract numeric values")
+                        logger.debug("Could not extract numeric values for price calculation")
                 except Exception as e:
-                    print(f"  ✗ Calculation failed: {e}")
+                    logger.debug("Price calculation failed: %s", e)
             else:
-                print(f"  ✗ Missing data for calculation")
+                logger.debug("Missing data for price calculation")
         
-        print(f"--- Final Discounted Price: {deal_data['discounted_price']} ---\n")
+        # Not a usable deal without both prices: skip the remaining extraction work
+        if deal_data.original_price == "Not found" or deal_data.discounted_price == "Not found":
+            logger.info("Skipped %s: no discount found", product_url)
+            return None
         
         # Extract Expiry Date
-        expiry_selectors = [
-            'span#deal-end-time',
-            'span[id*="timer"]',
-            'div[data-dealcountdownstring]',
-            'span[data-a-expiration-time]',
-            '#dealExpiry'
-        ]
-        for selector in expiry_selectors:
-            expiry = soup.select_one(selector)
-            if expiry:
-                deal_data["expiry_date"] = expiry.get_text(strip=True)
+        for selector in self._SEL_EXPIRY:
+            expiry = select_one(tree, selector)
+            if expiry is not None:
+                deal_data.expiry_date = text_of(expiry)
                 break
         
         # Extract Description with fallback selectors
-        desc_selectors = [
-            '#feature-bullets ul li',  # Primary selector
-            'div.a-expander-content.a-expander-partial-collapse-content ul li',  # Fallback for "About this item"
-            'div[class*="a-expander-content"] ul li'  # Additional fallback
-        ]
-        
-        for selector in desc_selectors:
-            desc_elements = soup.select(selector)
+        for selector in self._SEL_DESCRIPTION:
+            desc_elements = selector(tree)
             if desc_elements:
                 descriptions = []
                 for desc in desc_elements[:5]:
-                    text = desc.get_text(strip=True)
+                    text = text_of(desc)
                     if text and len(text) > 5:
                         descriptions.append(text)
                 if descriptions:
-                    deal_data["description"] = ' | '.join(descriptions)
+                    deal_data.description = ' | '.join(descriptions)
                     break  # Stop checking once found
         
         # Extract Product Image
-        img = soup.select_one('#imgTagWrapperId img')
-        if img:
+        img = select_one(tree, self._SEL_IMAGE)
+        if img is not None:
             img_url = (img.get('src') or 
                       img.get('data-old-hires') or 
                       img.get('data-a-dynamic-image'))
             
             if img_url and img_url.startswith('{'):
                 try:
-                    import json as json_lib
-                    img_dict = json_lib.loads(img_url)
+                    img_dict = orjson.loads(img_url)
                     img_url = list(img_dict.keys())[0] if img_dict else None
                 except:
                     pass
             
             if img_url:
-                deal_data["product_image"] = img_url
+                deal_data.product_image = img_url
         
+        logger.info("Scraped %s (original: %s, discounted: %s)",
+                    product_url, deal_data.original_price, deal_data.discounted_price)
+        self._detail_cache.put(product_url, deal_data)
         return deal_data
     
-    def scrape_deals(self, deals_page_url, max_deals=None):
-        """Main method to scrape all deals"""
-        deal_links = self.extract_deal_links(deals_page_url)
+    def scrape_deals(self, deals_page_url, max_deals=None, max_workers=MAX_WORKERS):
+        """Main method to scrape all deals, fetching product pages concurrently"""
+        # islice stops parsing the listing as soon as max_deals links are found
+        deal_links = list(islice(self.iter_deal_links(deals_page_url), max_deals or None))
         
         if not deal_links:
-            print("No deals found on the page")
+            logger.warning("No deals found on the page")
             return []
         
-        if max_deals:
-            deal_links = deal_links[:max_deals]
-        
         all_deals = []
-        for i, link in enumerate(deal_links, 1):
-            print(f"\n{'='*60}")
-            print(f"Processing deal {i}/{len(deal_links)}")
-            print(f"{'='*60}")
-            
-            deal_data = self.extract_deal_details(link)
-            if deal_data:
-                all_deals.append(deal_data)
-                print(f"\n✓ Successfully scraped deal {i}")
-            else:
-                print(f"\n✗ Failed to scrape: {link}")
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # map() yields results in link order
+            results = executor.map(self.extract_deal_details, deal_links)
+            for link, deal_data in zip(deal_links, results):
+                if deal_data:
+                    all_deals.append(deal_data)
+                else:
+                    logger.debug("Failed to scrape or not a deal: %s", link)
         
         return all_deals
     
     def save_to_json(self, data, filename='amazon_deals.json'):
         """Save scraped data to JSON file"""
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
-        print(f"\n✓ Data saved to {filename}")
+        Path(filename).write_bytes(
+            orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        )
+        logger.info("Data saved to %s", filename)
     
     def print_summary(self, deals):
         """Print a summary of scraped deals"""
@@ -324,12 +371,13 @@ class AmazonDealsScraper:
             
             for i, deal in enumerate(deals, 1):
                 print(f"\n--- Deal #{i} ---")
-                for key, value in deal.items():
+                for key, value in deal.to_dict().items():
                     if key != 'url':
                         print(f"{key.replace('_', ' ').title()}: {value}")
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
     scraper = AmazonDealsScraper()
     
     deals_url = input("Enter Amazon deals page URL: ").strip()
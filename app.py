@@ -1,281 +1,493 @@
-from flask import Flask, jsonify, request, send_from_directory
+from flask import Flask, Response, jsonify, request, send_from_directory
 from flask_cors import CORS
-import json
+import brotli
+import functools
+import gzip
+import logging
+import orjson
 import os
+import re
 import threading
-import time
-from urllib.parse import urlparse
-from amazon_scraper import AmazonDealsScraper
-from noon_scraper import NoonProductScraper
+import uuid
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, replace
+from itertools import islice
+from typing import Dict
+from models import Deal
+
+DEBUG_MODE = os.environ.get('FLASK_ENV', 'development') == 'development'
+
+# Per-request detail is logged at DEBUG, so production only pays for a level check
+logging.basicConfig(
+    level=logging.DEBUG if DEBUG_MODE else logging.INFO,
+    format='%(asctime)s %(levelname)s %(name)s: %(message)s'
+)
+logger = logging.getLogger(__name__)
 
 app = Flask(__name__, static_folder='.')
 CORS(app)
 
-# In-memory storage for deals (replaces JSON files for cloud deployment)
-amazon_deals_storage = []
-noon_deals_storage = []
-
-# Global variables to track scraping status for each platform
-amazon_scraping_status = {
-    'is_scraping': False,
-    'progress': 0,
-    'total': 0,
-    'deals_scraped': 0,
-    'deals_requested': 0,
-    'message': 'Ready'
-}
+# Scrapers are shared across jobs so their sessions keep connections alive between
+# runs. They are imported and built on first use, so workers that only serve
+# /api/deals and /api/status never load requests or lxml.
+@functools.lru_cache(maxsize=None)
+def get_amazon_scraper():
+    """Return the shared Amazon scraper, creating it on first call"""
+    from amazon_scraper import AmazonDealsScraper
+    return AmazonDealsScraper()
+
+@functools.lru_cache(maxsize=None)
+def get_noon_scraper():
+    """Return the shared Noon scraper, creating it on first call"""
+    from noon_scraper import NoonProductScraper
+    return NoonProductScraper()
+
+# Concurrent Noon product page fetches per scrape job
+NOON_MAX_WORKERS = int(os.environ.get('NOON_MAX_WORKERS', 8))
+
+# StatusTracker.try_start admits at most one job per platform. Jobs run on daemon
+# threads so an unfinished scrape never blocks interpreter exit.
+def start_scrape_job(target, *args):
+    """Run a scrape job in the background"""
+    threading.Thread(target=target, args=args, name='scrape-job', daemon=True).start()
+
+# Progress is published at most this many times per job; pollers read it about once a second
+STATUS_UPDATES_PER_JOB = 100
+
+# Placeholder for fields a scraper could not extract, and the currency every deal is priced in
+NOT_FOUND = 'Not found'
+CURRENCY = 'AED'
+
+# Matches an http(s) URL whose host has amazon or noon as a label followed by a
+# suffix (amazon.ae, www.noon.com); userinfo is skipped, and the host must end at
+# the path, query, fragment or end of the URL, so the name in a path never counts
+_PLATFORM_RE = re.compile(r'^https?://(?:[^/?#]*@)?(?:[^./?#@]+\.)*(amazon|noon)\.[^/?#@]*(?:[/?#]|$)', re.IGNORECASE)
+
+# Bumped whenever a platform's deals are replaced; used to build /api/deals ETags
+deals_version = {'amazon': 0, 'noon': 0}
+_ETAG_PREFIX = uuid.uuid4().hex[:8]  # Keeps ETags from colliding across restarts
+
+# Deals responses are mostly long descriptions and URLs, so they compress well
+_GZIP_LEVEL = 6
+_BROTLI_QUALITY = 9
 
-noon_scraping_status = {
-    'is_scraping': False,
-    'progress': 0,
-    'total': 0,
-    'deals_scraped': 0,
-    'deals_requested': 0,
-    'message': 'Ready'
+@dataclass(frozen=True, slots=True)
+class DealsPayload:
+    """A platform's stored deals with its /api/deals response pre-built"""
+    deals: list
+    etag: str
+    body: bytes
+    gzip_body: bytes
+    br_body: bytes
+
+def build_deals_payload(platform, deals):
+    """Serialize and compress the /api/deals response for a list of deals"""
+    deals_version[platform] += 1
+    body = orjson.dumps({
+        'success': True,
+        'deals': deals,
+        'count': len(deals),
+        'platform': platform
+    })
+    return DealsPayload(
+        deals=deals,
+        etag=f"{_ETAG_PREFIX}-{platform}-{deals_version[platform]}",
+        body=body,
+        gzip_body=gzip.compress(body, compresslevel=_GZIP_LEVEL),
+        br_body=brotli.compress(body, mode=brotli.MODE_TEXT, quality=_BROTLI_QUALITY)
+    )
+
+# In-memory storage for deals (replaces JSON files for cloud deployment).
+# Only deals that passed validation are ever stored here, and payloads are
+# never mutated: a finished scrape swaps in a new one, so request threads
+# read the deals, ETag and encoded bodies from a single consistent reference.
+deals_payloads = {
+    'amazon': build_deals_payload('amazon', []),
+    'noon': build_deals_payload('noon', [])
 }
 
+@dataclass(frozen=True, slots=True)
+class ScrapeStatus:
+    """Immutable snapshot of one platform's scraping progress"""
+    is_scraping: bool = False
+    progress: int = 0
+    total: int = 0
+    deals_scraped: int = 0
+    deals_requested: int = 0
+    message: str = 'Ready'
+
+class StatusTracker:
+    """Publishes ScrapeStatus snapshots by swapping a single reference.
+
+    Writers serialize on a lock and replace the whole snapshot; readers just
+    load the current reference, which is atomic, so polling never blocks and
+    never sees a half-applied update. Each snapshot is serialized once when it
+    is published, so status polls do no JSON work at all.
+    """
+
+    def __init__(self):
+        self._write_lock = threading.Lock()
+        self._version = 0
+        self._publish(ScrapeStatus())
+
+    def _publish(self, snapshot: ScrapeStatus) -> None:
+        # Caller holds _write_lock (or is __init__). The body and its version are
+        # swapped in as one tuple so readers never pair one with the other's update.
+        self._version += 1
+        self.current = snapshot
+        self.serialized = (orjson.dumps(snapshot), self._version)
+
+    def update(self, **changes) -> None:
+        """Publish a new snapshot with the given fields changed"""
+        with self._write_lock:
+            self._publish(replace(self.current, **changes))
+
+    def try_start(self, deals_requested: int, message: str) -> bool:
+        """Atomically mark a scrape as started; returns False if one is already running"""
+        with self._write_lock:
+            if self.current.is_scraping:
+                return False
+            self._publish(ScrapeStatus(is_scraping=True, deals_requested=deals_requested, message=message))
+            return True
+
+# Scraping status for each platform
+amazon_scraping_status = StatusTracker()
+noon_scraping_status = StatusTracker()
+
 def detect_platform(url):
     """Detect if URL is from Amazon or Noon"""
-    try:
-        domain = urlparse(url).netloc.lower()
-        if 'amazon' in domain:
-            return 'amazon'
-        elif 'noon' in domain:
-            return 'noon'
-        return None
-    except:
+    if not isinstance(url, str):
         return None
+    match = _PLATFORM_RE.match(url)
+    return match.group(1).lower() if match else None
 
 def is_valid_amazon_deal(deal):
     """Check if Amazon deal has both original and discounted prices (not 'Not found')"""
-    return (deal.get('original_price', 'Not found') != 'Not found' and 
-            deal.get('discounted_price', 'Not found') != 'Not found' and
-            'AED' in deal.get('discounted_price', ''))
+    return (deal.original_price != NOT_FOUND and 
+            deal.discounted_price != NOT_FOUND and
+            CURRENCY in deal.discounted_price)
 
 def is_valid_noon_deal(deal):
     """Check if Noon deal has both original and discounted prices"""
-    return (deal.get('original_price') and deal.get('original_price') != 'Not found' and
-            deal.get('discounted_price') and deal.get('discounted_price') != 'Not found' and
-            deal.get('original_price') != deal.get('discounted_price'))
+    original_price = deal.original_price
+    discounted_price = deal.discounted_price
+    return bool(original_price and original_price != NOT_FOUND and
+                discounted_price and discounted_price != NOT_FOUND and
+                original_price != discounted_price)
+
+def deal_from_record(record):
+    """Build a Deal from a stored record, ignoring keys Deal has no field for (e.g. landed_cost)"""
+    return Deal(**{k: record[k] for k in Deal.__slots__ if k in record})
+
+def load_deal_records(records, is_valid, platform):
+    """Build valid Deals from stored records, skipping any record that cannot be read"""
+    deals = []
+    for record in records:
+        try:
+            deal = deal_from_record(record)
+            if is_valid(deal):
+                deals.append(deal)
+        except Exception as e:
+            logger.warning("Skipping unreadable %s deal record: %s", platform, e)
+    return deals
+
+def iter_jsonl_records(f):
+    """Yield the records of a JSON Lines file, skipping lines that fail to decode (e.g. one cut off by a crash)"""
+    for line_number, line in enumerate(f, 1):
+        if not line.strip():
+            continue
+        try:
+            yield orjson.loads(line)
+        except orjson.JSONDecodeError as e:
+            logger.warning("Skipping undecodable line %d: %s", line_number, e)
+
+def write_json_backup(filename, deals):
+    """Serialize deals with orjson and atomically replace filename with them"""
+    tmp_filename = f"{filename}.tmp"
+    try:
+        with open(tmp_filename, 'wb') as f:
+            f.write(orjson.dumps(deals, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        # A crash mid-write leaves the previous backup intact
+        os.replace(tmp_filename, filename)
+    except Exception as e:
+        logger.warning("Could not save to JSON file: %s", e)
+
+class BackupWriter:
+    """Writes JSON backups on a single daemon thread.
+
+    Only the newest pending snapshot per file is kept: if another scrape
+    finishes before a queued write runs, the stale snapshot is dropped
+    instead of being written first.
+    """
+
+    def __init__(self):
+        self._pending: Dict[str, list] = {}
+        self._cond = threading.Condition()
+        self._thread = threading.Thread(target=self._run, name='backup-writer', daemon=True)
+        self._thread.start()
+
+    def submit(self, filename, deals) -> None:
+        """Queue deals to be written to filename, replacing any pending write for it"""
+        with self._cond:
+            self._pending[filename] = deals
+            self._cond.notify()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._pending:
+                    self._cond.wait()
+                pending, self._pending = self._pending, {}
+            for filename, deals in pending.items():
+                write_json_backup(filename, deals)
+
+# Writes local JSON backups so scrapes finish without waiting on disk I/O
+BACKUP_WRITER = BackupWriter()
+
+def open_backup_file(filename):
+    """Open a JSON Lines backup file for writing, or return None if that fails (e.g. read-only disk)"""
+    try:
+        return open(filename, 'wb')
+    except OSError as e:
+        logger.warning("Could not open %s for writing: %s", filename, e)
+        return None
+
+def close_backup_file(backup):
+    """Close a backup file, logging instead of raising if buffered data cannot be written"""
+    try:
+        backup.close()
+    except OSError as e:
+        logger.warning("Could not close %s: %s", backup.name, e)
 
 def scrape_amazon_deals_background(url, max_deals=None):
     """Background function to scrape Amazon deals"""
-    global amazon_scraping_status, amazon_deals_storage
     
+    # start_scrape has already marked the status as running via try_start
     try:
-        amazon_scraping_status = {
-            'is_scraping': True,
-            'progress': 0,
-            'total': 0,
-            'deals_scraped': 0,
-            'deals_requested': max_deals if max_deals else 0,
-            'message': 'Starting Amazon scraper...'
-        }
-        
-        scraper = AmazonDealsScraper()
-        
-        # Extract deal links first
-        amazon_scraping_status['message'] = 'Finding deals...'
-        deal_links = scraper.extract_deal_links(url)
-        
-        if not deal_links:
-            amazon_scraping_status = {
-                'is_scraping': False,
-                'progress': 0,
-                'total': 0,
-                'deals_scraped': 0,
-                'deals_requested': max_deals if max_deals else 0,
-                'message': 'No deals found on the page'
-            }
-            return
-        
-        if max_deals:
-            deal_links = deal_links[:max_deals]
+        scraper = get_amazon_scraper()
         
-        amazon_scraping_status['total'] = len(deal_links)
-        amazon_scraping_status['deals_requested'] = max_deals if max_deals else len(deal_links)
+        amazon_scraping_status.update(message='Finding deals...')
         all_deals = []
         
-        # Scrape each deal
-        for i, link in enumerate(deal_links, 1):
-            amazon_scraping_status['progress'] = i
-            amazon_scraping_status['message'] = f'Scraping product {i} of {len(deal_links)}... Found {len(all_deals)} valid deals'
+        # Fetch product pages concurrently; the scraper's shared session pools
+        # connections and its rate limiter keeps requests polite
+        with ThreadPoolExecutor(max_workers=scraper.MAX_WORKERS) as executor:
+            # Producer: each link is queued for a worker as soon as it is parsed,
+            # so detail fetches start while the listing is still being walked
+            futures = {}
+            for position, link in enumerate(islice(scraper.iter_deal_links(url), max_deals or None)):
+                futures[executor.submit(scraper.extract_deal_details, link)] = (position, link)
+            deal_links = [link for _, link in futures.values()]
             
-            deal_data = scraper.extract_deal_details(link)
-            if deal_data and is_valid_amazon_deal(deal_data):
-                all_deals.append(deal_data)
-                amazon_scraping_status['deals_scraped'] = len(all_deals)
-                print(f"[PROGRESS] Product {i}/{len(deal_links)} - Valid deals found: {len(all_deals)}")
-        
-        # Filter only valid deals before saving
-        valid_deals = [deal for deal in all_deals if is_valid_amazon_deal(deal)]
+            if not deal_links:
+                amazon_scraping_status.update(
+                    is_scraping=False,
+                    progress=0,
+                    total=0,
+                    deals_scraped=0,
+                    deals_requested=max_deals if max_deals else 0,
+                    message='No deals found on the page'
+                )
+                return
+            
+            amazon_scraping_status.update(
+                total=len(deal_links),
+                deals_requested=max_deals if max_deals else len(deal_links),
+                message=f'Scraping {len(deal_links)} products...'
+            )
+            
+            # Local backup (optional, may not persist on cloud): each valid deal is
+            # appended as one JSON line, in page order, as soon as it is released
+            backup = open_backup_file('amazon_deals.jsonl')
+            try:
+                # Consumers: pool workers drain the queued links; results are handled as they
+                # finish, but held by listing position so deals are stored in page order
+                status_step = max(1, len(deal_links) // STATUS_UPDATES_PER_JOB)
+                completed = {}
+                next_position = 0
+                valid_count = 0
+                for i, future in enumerate(as_completed(futures), 1):
+                    position, link = futures[future]
+                    try:
+                        deal_data = future.result()
+                    except Exception:
+                        logger.exception("Error scraping Amazon product %s", link)
+                        deal_data = None
+                    
+                    if deal_data and is_valid_amazon_deal(deal_data):
+                        valid_count += 1
+                    else:
+                        deal_data = None
+                    completed[position] = deal_data
+                    
+                    # Release deals as soon as every product listed before them has finished
+                    while next_position in completed:
+                        deal_data = completed.pop(next_position)
+                        next_position += 1
+                        if deal_data is None:
+                            continue
+                        all_deals.append(deal_data)
+                        if backup:
+                            try:
+                                backup.write(orjson.dumps(deal_data) + b'\n')
+                                # Flushed per deal so a crash mid-scrape loses at most the line being written
+                                backup.flush()
+                            except OSError as e:
+                                # The backup is optional: stop writing it, but keep scraping
+                                logger.warning("Could not write amazon_deals.jsonl, disabling backup: %s", e)
+                                close_backup_file(backup)
+                                backup = None
+                    
+                    if i % status_step == 0 or i == len(deal_links):
+                        amazon_scraping_status.update(
+                            progress=i,
+                            deals_scraped=valid_count,
+                            message=f'Scraped product {i} of {len(deal_links)}... Found {valid_count} valid deals'
+                        )
+            finally:
+                if backup:
+                    close_backup_file(backup)
+        
+        # all_deals only holds deals that passed validation in the loop above
+        valid_deals = all_deals
         
         # Store in memory instead of JSON file (for cloud deployment)
-        amazon_deals_storage.clear()
-        amazon_deals_storage.extend(valid_deals)
+        deals_payloads['amazon'] = build_deals_payload('amazon', valid_deals)
         
-        # Also save to JSON for local backup (optional, may not persist on cloud)
-        try:
-            scraper.save_to_json(valid_deals, 'amazon_deals.json')
-        except Exception as e:
-            print(f"[WARNING] Could not save to JSON file: {e}")
-        
-        print(f"[INFO] Stored {len(valid_deals)} deals in memory")
+        logger.info("Stored %d Amazon deals in memory", len(valid_deals))
         
-        amazon_scraping_status = {
-            'is_scraping': False,
-            'progress': len(deal_links),
-            'total': len(deal_links),
-            'deals_scraped': len(valid_deals),
-            'deals_requested': max_deals if max_deals else len(deal_links),
-            'message': f'Successfully scraped {len(valid_deals)} valid deals out of {max_deals if max_deals else len(deal_links)} requested'
-        }
+        amazon_scraping_status.update(
+            is_scraping=False,
+            progress=len(deal_links),
+            total=len(deal_links),
+            deals_scraped=len(valid_deals),
+            deals_requested=max_deals if max_deals else len(deal_links),
+            message=f'Successfully scraped {len(valid_deals)} valid deals out of {max_deals if max_deals else len(deal_links)} requested'
+        )
         
     except Exception as e:
-        amazon_scraping_status = {
-            'is_scraping': False,
-            'progress': 0,
-            'total': 0,
-            'deals_scraped': 0,
-            'deals_requested': max_deals if max_deals else 0,
-            'message': f'Error: {str(e)}'
-        }
+        amazon_scraping_status.update(
+            is_scraping=False,
+            progress=0,
+            total=0,
+            deals_scraped=0,
+            deals_requested=max_deals if max_deals else 0,
+            message=f'Error: {str(e)}'
+        )
+
+@functools.lru_cache(maxsize=4096)
+def ensure_currency(price):
+    """Prefix a bare price with the currency; cached because many products share prices"""
+    if price == NOT_FOUND or price.startswith(CURRENCY):
+        return price
+    return f"{CURRENCY} {price}"
+
+def build_noon_deal(scraper, product_card):
+    """Scrape a Noon product's detail page and build a deal in the same format as Amazon"""
+    product_detail = scraper.scrape_product_detail(product_card.url)
+    
+    # Format prices to include AED currency if not present
+    original_price = ensure_currency(product_detail.original_price or product_card.original_price or NOT_FOUND)
+    discounted_price = ensure_currency(product_detail.offered_price or product_card.offered_price or NOT_FOUND)
+    
+    return Deal(
+        url=product_card.url,
+        title=product_detail.title or product_card.title or NOT_FOUND,
+        brand=NOT_FOUND,  # Noon doesn't always have brand easily accessible
+        category=NOT_FOUND,
+        original_price=original_price,
+        discounted_price=discounted_price,
+        discount_percentage=product_detail.profit or NOT_FOUND,
+        expiry_date=NOT_FOUND,
+        description=product_detail.description or NOT_FOUND,
+        product_image=product_detail.image or product_card.image or NOT_FOUND
+    )
 
 def scrape_noon_deals_background(url, max_deals=None):
     """Background function to scrape Noon deals"""
-    global noon_scraping_status, noon_deals_storage
     
     try:
-        print(f"\n{'='*60}")
-        print(f"[INFO] Starting Noon scraper")
-        print(f"[INFO] URL: {url}")
-        print(f"[INFO] Max deals requested: {max_deals}")
-        print(f"{'='*60}\n")
-        
-        noon_scraping_status = {
-            'is_scraping': True,
-            'progress': 0,
-            'total': 0,
-            'deals_scraped': 0,
-            'deals_requested': max_deals if max_deals else 0,
-            'message': 'Starting Noon scraper...'
-        }
+        logger.info("Starting Noon scraper for %s (max deals: %s)", url, max_deals)
         
-        scraper = NoonProductScraper()
+        scraper = get_noon_scraper()
         
         # Get product list from page
-        noon_scraping_status['message'] = 'Finding deals...'
-        print(f"[INFO] Fetching product list from Noon...")
-        product_cards = scraper.scrape_products_from_list(url, only_deals=True)
-        print(f"[INFO] Found {len(product_cards) if product_cards else 0} products on page")
+        noon_scraping_status.update(message='Finding deals...')
+        # islice stops extracting cards once max_deals products have been found
+        product_cards = list(islice(scraper.iter_products_from_list(url, only_deals=True), max_deals or None))
+        logger.info("Found %d products on page", len(product_cards) if product_cards else 0)
         
         if not product_cards:
-            noon_scraping_status = {
-                'is_scraping': False,
-                'progress': 0,
-                'total': 0,
-                'deals_scraped': 0,
-                'deals_requested': max_deals if max_deals else 0,
-                'message': 'No deals found on the page'
-            }
+            noon_scraping_status.update(
+                is_scraping=False,
+                progress=0,
+                total=0,
+                deals_scraped=0,
+                deals_requested=max_deals if max_deals else 0,
+                message='No deals found on the page'
+            )
             return
         
-        if max_deals:
-            product_cards = product_cards[:max_deals]
-        
-        noon_scraping_status['total'] = len(product_cards)
-        noon_scraping_status['deals_requested'] = max_deals if max_deals else len(product_cards)
+        noon_scraping_status.update(
+            total=len(product_cards),
+            deals_requested=max_deals if max_deals else len(product_cards)
+        )
         all_deals = []
-        
-        # Scrape details for each product
-        for i, product_card in enumerate(product_cards, 1):
-            noon_scraping_status['progress'] = i
-            noon_scraping_status['message'] = f'Scraping product {i} of {len(product_cards)}... Found {len(all_deals)} valid deals'
-            
-            # Add small delay to avoid overwhelming the server
-            if i > 1:
-                time.sleep(1)  # 1 second delay between products
-            
-            try:
-                product_detail = scraper.scrape_product_detail(product_card.url)
-                
-                # Format prices to include AED currency if not present
-                original_price = product_detail.original_price or product_card.original_price or 'Not found'
-                discounted_price = product_detail.offered_price or product_card.offered_price or 'Not found'
-                
-                # Add AED prefix if it's just a number
-                if original_price != 'Not found' and not original_price.startswith('AED'):
-                    original_price = f"AED {original_price}"
-                if discounted_price != 'Not found' and not discounted_price.startswith('AED'):
-                    discounted_price = f"AED {discounted_price}"
-                
-                # Create deal object in similar format to Amazon
-                deal_data = {
-                    'url': product_card.url,
-                    'title': product_detail.title or product_card.title or 'Not found',
-                    'brand': 'Not found',  # Noon doesn't always have brand easily accessible
-                    'category': 'Not found',
-                    'original_price': original_price,
-                    'discounted_price': discounted_price,
-                    'discount_percentage': product_detail.profit or 'Not found',
-                    'expiry_date': 'Not found',
-                    'description': product_detail.description or 'Not found',
-                    'product_image': product_detail.image or product_card.image or 'Not found'
-                }
+        noon_scraping_status.update(message=f'Scraping {len(product_cards)} products...')
+        
+        # Scrape details concurrently; the scraper's per-host rate limiter replaces
+        # the old fixed one-second sleep between products
+        with ThreadPoolExecutor(max_workers=NOON_MAX_WORKERS) as executor:
+            futures = {executor.submit(build_noon_deal, scraper, card): card for card in product_cards}
+            status_step = max(1, len(product_cards) // STATUS_UPDATES_PER_JOB)
+            for i, future in enumerate(as_completed(futures), 1):
+                product_card = futures[future]
+                try:
+                    deal_data = future.result()
+                    if is_valid_noon_deal(deal_data):
+                        all_deals.append(deal_data)
+                    else:
+                        logger.debug("Noon product skipped - validation failed: %s", product_card.url)
+                except Exception:
+                    logger.exception("Error scraping Noon product %s", product_card.url)
                 
-                print(f"[DEBUG Noon] Product {i}: {deal_data.get('title', 'N/A')[:50]}")
-                print(f"[DEBUG Noon] Original: {deal_data.get('original_price')}, Discounted: {deal_data.get('discounted_price')}")
-                print(f"[DEBUG Noon] Is valid: {is_valid_noon_deal(deal_data)}")
-                
-                if is_valid_noon_deal(deal_data):
-                    all_deals.append(deal_data)
-                    noon_scraping_status['deals_scraped'] = len(all_deals)
-                    print(f"[PROGRESS] Product {i}/{len(product_cards)} - Valid deals found: {len(all_deals)}")
-                else:
-                    print(f"[DEBUG Noon] Product skipped - validation failed")
-            except Exception as e:
-                print(f"[ERROR Noon] Error scraping product {i}: {str(e)}")
-                import traceback
-                traceback.print_exc()
-                continue
+                if i % status_step == 0 or i == len(product_cards):
+                    noon_scraping_status.update(
+                        progress=i,
+                        deals_scraped=len(all_deals),
+                        message=f'Scraped product {i} of {len(product_cards)}... Found {len(all_deals)} valid deals'
+                    )
         
-        # Filter only valid deals before saving
-        valid_deals = [deal for deal in all_deals if is_valid_noon_deal(deal)]
+        # all_deals only holds deals that passed validation in the loop above
+        valid_deals = all_deals
         
         # Store in memory instead of JSON file (for cloud deployment)
-        noon_deals_storage.clear()
-        noon_deals_storage.extend(valid_deals)
+        deals_payloads['noon'] = build_deals_payload('noon', valid_deals)
         
         # Also save to JSON for local backup (optional, may not persist on cloud)
-        try:
-            with open('noon_deals.json', 'w', encoding='utf-8') as f:
-                json.dump(valid_deals, f, indent=2, ensure_ascii=False)
-        except Exception as e:
-            print(f"[WARNING] Could not save to JSON file: {e}")
+        BACKUP_WRITER.submit('noon_deals.json', valid_deals)
         
-        print(f"[INFO] Stored {len(valid_deals)} deals in memory")
+        logger.info("Stored %d Noon deals in memory", len(valid_deals))
         
-        noon_scraping_status = {
-            'is_scraping': False,
-            'progress': len(product_cards),
-            'total': len(product_cards),
-            'deals_scraped': len(valid_deals),
-            'deals_requested': max_deals if max_deals else len(product_cards),
-            'message': f'Successfully scraped {len(valid_deals)} valid deals out of {max_deals if max_deals else len(product_cards)} requested'
-        }
+        noon_scraping_status.update(
+            is_scraping=False,
+            progress=len(product_cards),
+            total=len(product_cards),
+            deals_scraped=len(valid_deals),
+            deals_requested=max_deals if max_deals else len(product_cards),
+            message=f'Successfully scraped {len(valid_deals)} valid deals out of {max_deals if max_deals else len(product_cards)} requested'
+        )
         
     except Exception as e:
-        print(f"\n[ERROR] Noon scraping failed with error: {str(e)}")
-        import traceback
-        traceback.print_exc()
-        noon_scraping_status = {
-            'is_scraping': False,
-            'progress': 0,
-            'total': 0,
-            'deals_scraped': 0,
-            'deals_requested': max_deals if max_deals else 0,
-            'message': f'Error: {str(e)}'
-        }
+        logger.exception("Noon scraping failed")
+        noon_scraping_status.update(
+            is_scraping=False,
+            progress=0,
+            total=0,
+            deals_scraped=0,
+            deals_requested=max_deals if max_deals else 0,
+            message=f'Error: {str(e)}'
+        )
 
 @app.route('/')
 def index():
@@ -285,8 +497,6 @@ def index():
 @app.route('/api/scrape', methods=['POST'])
 def start_scrape():
     """Start scraping process - detects platform automatically"""
-    global amazon_scraping_status, noon_scraping_status
-    
     data = request.json
     url = data.get('url', '')
     max_deals = data.get('max_deals', None)
@@ -301,16 +511,14 @@ def start_scrape():
     platform = detect_platform(url)
     
     if platform == 'amazon':
-        if amazon_scraping_status['is_scraping']:
+        if not amazon_scraping_status.try_start(max_deals or 0, 'Starting Amazon scraper...'):
             return jsonify({
                 'success': False,
                 'message': 'Amazon scraping is already in progress'
             }), 400
         
-        # Start Amazon scraping in background thread
-        thread = threading.Thread(target=scrape_amazon_deals_background, args=(url, max_deals))
-        thread.daemon = True
-        thread.start()
+        # Start Amazon scraping in the background
+        start_scrape_job(scrape_amazon_deals_background, url, max_deals)
         
         return jsonify({
             'success': True,
@@ -319,16 +527,14 @@ def start_scrape():
         })
     
     elif platform == 'noon':
-        if noon_scraping_status['is_scraping']:
+        if not noon_scraping_status.try_start(max_deals or 0, 'Starting Noon scraper...'):
             return jsonify({
                 'success': False,
                 'message': 'Noon scraping is already in progress'
             }), 400
         
-        # Start Noon scraping in background thread
-        thread = threading.Thread(target=scrape_noon_deals_background, args=(url, max_deals))
-        thread.daemon = True
-        thread.start()
+        # Start Noon scraping in the background
+        start_scrape_job(scrape_noon_deals_background, url, max_deals)
         
         return jsonify({
             'success': True,
@@ -348,9 +554,20 @@ def get_status():
     platform = request.args.get('platform', 'amazon')
     
     if platform == 'noon':
-        return jsonify(noon_scraping_status)
+        body, version = noon_scraping_status.serialized
+        etag = f"{_ETAG_PREFIX}-noon-status-{version}"
     else:
-        return jsonify(amazon_scraping_status)
+        body, version = amazon_scraping_status.serialized
+        etag = f"{_ETAG_PREFIX}-amazon-status-{version}"
+    
+    # The body was serialized when the status was published; just wrap it
+    if etag in request.if_none_match:
+        response = Response(status=304)
+    else:
+        response = Response(body, mimetype='application/json')
+    response.set_etag(etag)
+    response.cache_control.no_cache = True
+    return response
 
 @app.route('/api/deals', methods=['GET'])
 def get_deals():
@@ -358,29 +575,32 @@ def get_deals():
     platform = request.args.get('platform', 'amazon')
     
     try:
-        # Get deals from memory storage
-        if platform == 'noon':
-            deals = noon_deals_storage.copy()
+        # Storage only ever holds validated deals, so no re-filtering is needed,
+        # and the response was serialized and compressed when it was stored
+        payload = deals_payloads['noon' if platform == 'noon' else 'amazon']
+        
+        # Unchanged since the client's last poll: send nothing. The ETag is weak
+        # because the same deals are sent under several content encodings.
+        if request.if_none_match.contains_weak(payload.etag):
+            response = Response(status=304)
         else:
-            deals = amazon_deals_storage.copy()
-        
-        print(f"[API] Returning {len(deals)} {platform} deals from memory")
-        
-        # Filter to only include valid deals
-        if platform == 'noon':
-            valid_deals = [deal for deal in deals if is_valid_noon_deal(deal)]
-        else:
-            valid_deals = [deal for deal in deals if is_valid_amazon_deal(deal)]
-        
-        return jsonify({
-            'success': True,
-            'deals': valid_deals,
-            'count': len(valid_deals),
-            'platform': platform
-        })
+            logger.debug("Returning %d %s deals from memory", len(payload.deals), platform)
+            accept_encodings = request.accept_encodings
+            if accept_encodings['br']:
+                response = Response(payload.br_body, mimetype='application/json')
+                response.content_encoding = 'br'
+            elif accept_encodings['gzip']:
+                response = Response(payload.gzip_body, mimetype='application/json')
+                response.content_encoding = 'gzip'
+            else:
+                response = Response(payload.body, mimetype='application/json')
+        response.vary.add('Accept-Encoding')
+        response.set_etag(payload.etag, weak=True)
+        response.cache_control.max_age = 1
+        return response
         
     except Exception as e:
-        print(f"[ERROR] Error getting deals: {e}")
+        logger.exception("Error getting deals")
         return jsonify({
             'success': False,
             'message': str(e),
@@ -391,32 +611,36 @@ def get_deals():
 
 def load_existing_deals_to_memory():
     """Load existing JSON files into memory on startup (for local development)"""
-    global amazon_deals_storage, noon_deals_storage
-    
     # Try to load Amazon deals
     try:
-        if os.path.exists('amazon_deals.json'):
-            with open('amazon_deals.json', 'r', encoding='utf-8') as f:
-                deals = json.load(f)
-                amazon_deals_storage.extend(deals)
-                print(f"[STARTUP] Loaded {len(deals)} Amazon deals from file into memory")
+        if os.path.exists('amazon_deals.jsonl'):
+            with open('amazon_deals.jsonl', 'rb') as f:
+                deals = load_deal_records(iter_jsonl_records(f), is_valid_amazon_deal, 'Amazon')
+                deals_payloads['amazon'] = build_deals_payload('amazon', deals)
+                logger.info("Loaded %d Amazon deals from file into memory", len(deals))
+        elif os.path.exists('amazon_deals.json'):
+            # Written by the command-line scraper as a single JSON array
+            with open('amazon_deals.json', 'rb') as f:
+                deals = load_deal_records(orjson.loads(f.read()), is_valid_amazon_deal, 'Amazon')
+                deals_payloads['amazon'] = build_deals_payload('amazon', deals)
+                logger.info("Loaded %d Amazon deals from file into memory", len(deals))
     except Exception as e:
-        print(f"[STARTUP] Could not load Amazon deals: {e}")
+        logger.warning("Could not load Amazon deals: %s", e)
     
     # Try to load Noon deals
     try:
         if os.path.exists('noon_deals.json'):
-            with open('noon_deals.json', 'r', encoding='utf-8') as f:
-                deals = json.load(f)
-                noon_deals_storage.extend(deals)
-                print(f"[STARTUP] Loaded {len(deals)} Noon deals from file into memory")
+            with open('noon_deals.json', 'rb') as f:
+                deals = load_deal_records(orjson.loads(f.read()), is_valid_noon_deal, 'Noon')
+                deals_payloads['noon'] = build_deals_payload('noon', deals)
+                logger.info("Loaded %d Noon deals from file into memory", len(deals))
     except Exception as e:
-        print(f"[STARTUP] Could not load Noon deals: {e}")
+        logger.warning("Could not load Noon deals: %s", e)
 
 if __name__ == '__main__':
     # Get port from environment variable or default to 5000
     port = int(os.environ.get('PORT', 5000))
-    debug_mode = os.environ.get('FLASK_ENV', 'development') == 'development'
+    debug_mode = DEBUG_MODE
     
     print("=" * 60)
     print("🚀 Amazon Deals Scraper Server Starting...")
@@ -0,0 +1,47 @@
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+import threading
+import time
+
+
+class LRUCache:
+    """Thread-safe least-recently-used cache with an optional time-to-live"""
+
+    def __init__(self, maxsize: int = 1024, ttl: Optional[float] = None):
+        """
+        Initialize an empty cache
+
+        Args:
+            maxsize (int): Maximum number of entries kept before evicting the oldest
+            ttl (float, optional): Seconds an entry stays valid (default: None, never expires)
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict = OrderedDict()  # key -> (stored_at, value)
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value for key, or None if it is missing or expired"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            stored_at, value = entry
+            if self.ttl is not None and time.monotonic() - stored_at > self.ttl:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Store value under key, evicting the least recently used entry if full"""
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all entries"""
+        with self._lock:
+            self._entries.clear()
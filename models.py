@@ -0,0 +1,21 @@
+from dataclasses import dataclass, asdict
+from typing import Dict
+
+
+@dataclass(slots=True)
+class Deal:
+    """Data class for a single deal extracted from a product page"""
+    url: str
+    title: str = "Not found"
+    brand: str = "Not found"
+    category: str = "Not found"
+    original_price: str = "Not found"
+    discounted_price: str = "Not found"
+    discount_percentage: str = "Not found"
+    expiry_date: str = "Not found"
+    description: str = "Not found"
+    product_image: str = "Not found"
+
+    def to_dict(self) -> Dict:
+        """Convert deal data to dictionary"""
+        return asdict(self)
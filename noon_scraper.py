@@ -1,10 +1,33 @@
 import requests
-from bs4 import BeautifulSoup
-from typing import Dict, List, Optional, Set
-from dataclasses import dataclass, asdict
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from lxml.cssselect import CSSSelector
+from lxml.html import HtmlElement
+from typing import Dict, Iterator, List, Optional, Set
+from dataclasses import dataclass
+from pathlib import Path
 from urllib.parse import urlparse
-import json
-import time
+import logging
+import orjson
+import sys
+
+from cache import LRUCache
+from parsing import ParserError, css, parse_html, text_of
+from ratelimit import TokenBucket
+
+logger = logging.getLogger(__name__)
+
+# Size button state classes; module-level interned strings, so their hashes are computed once
+_SIZE_ACTIVE = sys.intern("ButtonOptions-module-scss-module__Pu6iuq__active")
+_SIZE_DISABLED = sys.intern("ButtonOptions-module-scss-module__Pu6iuq__disabled")
+_SIZE_OUT_OF_STOCK = sys.intern("ButtonOptions-module-scss-module__Pu6iuq__oos")
+
+
+def _compile_all(selectors: Dict[str, str]) -> Dict[str, CSSSelector]:
+    """Translate a table of CSS selectors to compiled XPath once, so matching is a single evaluation"""
+    return {name: css(selector) for name, selector in selectors.items()}
 
 
 @dataclass
@@ -18,7 +41,13 @@ class Size:
 
     def to_dict(self) -> Dict:
         """Convert size data to dictionary"""
-        return asdict(self)
+        return {
+            "label": self.label,
+            "link": self.link,
+            "is_active": self.is_active,
+            "is_disabled": self.is_disabled,
+            "is_out_of_stock": self.is_out_of_stock,
+        }
 
 
 @dataclass
@@ -32,17 +61,13 @@ class ProductCard:
     
     def to_dict(self) -> Dict:
         """Convert to dictionary"""
-        return asdict(self)
-    
-    def __hash__(self) -> int:
-        """Make dataclass hashable for deduplication"""
-        return hash(self.url)
-    
-    def __eq__(self, other) -> bool:
-        """Compare by URL for deduplication"""
-        if not isinstance(other, ProductCard):
-            return False
-        return self.url == other.url
+        return {
+            "url": self.url,
+            "title": self.title,
+            "image": self.image,
+            "offered_price": self.offered_price,
+            "original_price": self.original_price,
+        }
 
 
 @dataclass
@@ -66,7 +91,16 @@ class ProductDetail:
 
     def to_dict(self) -> Dict:
         """Convert product data to dictionary"""
-        return asdict(self)
+        return {
+            "image": self.image,
+            "title": self.title,
+            "offered_price": self.offered_price,
+            "original_price": self.original_price,
+            "profit": self.profit,
+            "description": self.description,
+            "thumbnails": list(self.thumbnails),
+            "sizes": [size.to_dict() for size in self.sizes],
+        }
 
 
 class NoonProductScraper:
@@ -94,7 +128,26 @@ class NoonProductScraper:
         "original_price": ".Price-module-scss-module__q-4KEG__oldPrice",
     }
     
+    # Compiled forms of the selector tables above, used for all matching
+    COMPILED_SELECTORS = _compile_all(SELECTORS)
+    COMPILED_LIST_SELECTORS = _compile_all(LIST_SELECTORS)
+    
+    # Card sub-fields are single-class selectors, so one walk over a card can
+    # find them all by class name: {class name: LIST_SELECTORS key}
+    CARD_FIELD_CLASSES = {
+        selector.lstrip('.'): name
+        for name, selector in LIST_SELECTORS.items()
+        if name != "product_card"
+    }
+    
+    MAX_WORKERS = 16  # Concurrent product page fetches when checking a list for deals
     TIMEOUT = 30  # Request timeout in seconds (increased from 10)
+    RETRIES = 2  # Retries per request (3 attempts) for connection errors, timeouts and 429/5xx responses
+    POOL_SIZE = 32  # Keep-alive connections kept per host; at least the number of fetch threads
+    DETAIL_CACHE_SIZE = 4096  # Product detail pages remembered across scrape runs
+    DETAIL_CACHE_TTL = 15 * 60  # Seconds before a cached detail page is re-fetched
+    RATE_LIMIT = 1.0  # Requests per second allowed per host
+    RATE_BURST = 2  # Requests per host allowed back-to-back before throttling
     
     def __init__(self, timeout: int = TIMEOUT):
         """
@@ -104,28 +157,44 @@ class NoonProductScraper:
             timeout (int): Request timeout in seconds (default: 30)
         """
         self.timeout = timeout
-        self.missing_selectors: List[str] = []
+        # Product details keyed by URL, so repeat scrapes skip the fetch and parse
+        self._detail_cache = LRUCache(self.DETAIL_CACHE_SIZE, self.DETAIL_CACHE_TTL)
+        # Shared by all threads using this scraper, so concurrent fetches stay polite
+        self._rate_limiter = TokenBucket(self.RATE_LIMIT, self.RATE_BURST)
         # Create a persistent session for better performance
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
             'Accept-Language': 'en-US,en;q=0.9',
-            'Accept-Encoding': 'gzip, deflate',
+            # Every encoding urllib3 can decode here: gzip/deflate, plus br and zstd
+            # when brotli and zstandard are installed
+            'Accept-Encoding': ACCEPT_ENCODING,
             'Connection': 'keep-alive',
             'Upgrade-Insecure-Requests': '1'
         })
+        # Pool keep-alive connections so repeat requests to noon.com skip the TLS handshake,
+        # and let urllib3 retry transient failures: the first retry is immediate,
+        # the second waits backoff_factor * 2 = 4s
+        adapter = HTTPAdapter(
+            pool_connections=self.POOL_SIZE,
+            pool_maxsize=self.POOL_SIZE,
+            max_retries=Retry(total=self.RETRIES, backoff_factor=2,
+                              status_forcelist=(429, 500, 502, 503, 504),
+                              raise_on_status=False)
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
     
-    def fetch_page(self, url: str, retries: int = 3) -> Optional[BeautifulSoup]:
+    def fetch_page(self, url: str) -> Optional[HtmlElement]:
         """
-        Fetch the webpage and parse it with retry logic
+        Fetch the webpage and parse it (retries are handled by the session's adapter)
         
         Args:
             url (str): The URL to scrape
-            retries (int): Number of retry attempts (default: 3)
             
         Returns:
-            BeautifulSoup: Parsed HTML content
+            HtmlElement: Root of the parsed HTML tree
             
         Raises:
             ValueError: If URL is invalid or page fails to load after retries
@@ -138,80 +207,61 @@ class NoonProductScraper:
         except Exception as e:
             raise ValueError(f"URL validation failed: {e}")
         
-        # Attempt to fetch the webpage with retries
-        last_error = None
-        for attempt in range(retries):
-            try:
-                # Add a small delay between retries to avoid rate limiting
-                if attempt > 0:
-                    time.sleep(2 * attempt)  # Progressive delay: 2s, 4s
-                    
-                response = self.session.get(url, timeout=self.timeout)
-                response.raise_for_status()
-                
-                return BeautifulSoup(response.content, 'html.parser')
-                
-            except requests.exceptions.Timeout as e:
-                last_error = f"Request timeout: Page took longer than {self.timeout} seconds to load"
-                print(f"[WARNING] Attempt {attempt + 1}/{retries} failed: Timeout")
-                if attempt < retries - 1:
-                    continue
-            except requests.exceptions.ConnectionError as e:
-                last_error = "Connection error: Failed to connect to the website. Check your internet connection."
-                print(f"[WARNING] Attempt {attempt + 1}/{retries} failed: Connection error")
-                if attempt < retries - 1:
-                    continue
-            except requests.exceptions.HTTPError as e:
-                status_code = e.response.status_code
-                last_error = f"HTTP Error {status_code}: The webpage returned an error."
-                print(f"[WARNING] Attempt {attempt + 1}/{retries} failed: HTTP {status_code}")
-                if attempt < retries - 1:
-                    continue
-            except Exception as e:
-                last_error = f"Failed to fetch webpage: {str(e)}"
-                print(f"[WARNING] Attempt {attempt + 1}/{retries} failed: {str(e)}")
-                if attempt < retries - 1:
-                    continue
+        try:
+            self._rate_limiter.acquire(result.netloc)
+            response = self.session.get(url, timeout=self.timeout)
+            response.raise_for_status()
+        except requests.exceptions.Timeout:
+            raise ValueError(f"Request timeout: Page took longer than {self.timeout} seconds to load")
+        except requests.exceptions.ConnectionError:
+            raise ValueError("Connection error: Failed to connect to the website. Check your internet connection.")
+        except requests.exceptions.HTTPError as e:
+            raise ValueError(f"HTTP Error {e.response.status_code}: The webpage returned an error.")
+        except Exception as e:
+            raise ValueError(f"Failed to fetch webpage: {str(e)}")
         
-        # All retries failed
-        raise ValueError(last_error if last_error else "Failed to fetch webpage after multiple attempts")
+        # Parse the raw bytes with this thread's reusable lxml parser
+        try:
+            return parse_html(response.content)
+        except ParserError as e:
+            raise ValueError(f"Failed to parse webpage: {e}")
     
-    def _extract_attribute(self, soup: BeautifulSoup, selector: str, attribute: str = "text") -> Optional[str]:
+    def _extract_attribute(self, tree: HtmlElement, selector: CSSSelector, attribute: str = "text") -> Optional[str]:
         """
         Extract data from a specific selector
         
         Args:
-            soup (BeautifulSoup): Parsed HTML content
-            selector (str): CSS selector
+            tree (HtmlElement): Parsed HTML content
+            selector (CSSSelector): Compiled CSS selector
             attribute (str): Attribute to extract ('text' for element text, or specific HTML attribute)
             
         Returns:
             str: Extracted data or None if not found
         """
         try:
-            element = soup.select_one(selector)
-            if element:
+            matches = selector(tree)
+            if matches:
                 if attribute == "text":
-                    return element.get_text(strip=True)
+                    return text_of(matches[0])
                 else:
-                    return element.get(attribute)
+                    return matches[0].get(attribute)
             return None
         except Exception:
             return None
     
-    def _extract_thumbnails(self, soup: BeautifulSoup, selector: str) -> List[str]:
+    def _extract_thumbnails(self, tree: HtmlElement, selector: CSSSelector) -> List[str]:
         """
         Extract multiple thumbnail URLs from selector
         
         Args:
-            soup (BeautifulSoup): Parsed HTML content
-            selector (str): CSS selector for thumbnail images
+            tree (HtmlElement): Parsed HTML content
+            selector (CSSSelector): Compiled CSS selector for thumbnail images
             
         Returns:
             List[str]: List of thumbnail URLs
         """
         try:
-            elements = soup.select(selector)
+            elements = selector(tree)
             thumbnails = []
             for element in elements:
                 src = element.get("src")
@@ -221,33 +271,33 @@ class NoonProductScraper:
         except Exception:
             return []
     
-    def _extract_sizes(self, soup: BeautifulSoup, selector: str) -> List[Size]:
+    def _extract_sizes(self, tree: HtmlElement, selector: CSSSelector) -> List[Size]:
         """
         Extract size options from selector
         
         Args:
-            soup (BeautifulSoup): Parsed HTML content
-            selector (str): CSS selector for size option buttons
+            tree (HtmlElement): Parsed HTML content
+            selector (CSSSelector): Compiled CSS selector for size option buttons
             
         Returns:
             List[Size]: List of Size objects with availability information
         """
         try:
-            elements = soup.select(selector)
+            elements = selector(tree)
             sizes = []
             
             for element in elements:
                 # Extract size label from text content
-                label = element.get_text(strip=True)
+                label = text_of(element)
                 
                 # Extract link
                 link = element.get("href")
                 
-                # Check classes for state information
-                classes = element.get("class", [])
-                is_active = "ButtonOptions-module-scss-module__Pu6iuq__active" in classes
-                is_disabled = "ButtonOptions-module-scss-module__Pu6iuq__disabled" in classes
-                is_out_of_stock = "ButtonOptions-module-scss-module__Pu6iuq__oos" in classes
+                # Check classes for state information (one set build, then three hash lookups)
+                classes = frozenset(element.get("class", "").split())
+                is_active = _SIZE_ACTIVE in classes
+                is_disabled = _SIZE_DISABLED in classes
+                is_out_of_stock = _SIZE_OUT_OF_STOCK in classes
                 
                 # Create Size object
                 size = Size(
@@ -263,23 +313,27 @@ class NoonProductScraper:
         except Exception:
             return []
     
-    def _validate_selectors(self, soup: BeautifulSoup) -> None:
+    def _match_card_fields(self, card: HtmlElement) -> Dict[str, HtmlElement]:
         """
-        Check if all required selectors are found on the page
+        Find the first element for each card sub-field in a single walk over the card
         
         Args:
-            soup (BeautifulSoup): Parsed HTML content
+            card (HtmlElement): Product card element
+            
+        Returns:
+            Dict[str, HtmlElement]: First matching element keyed by LIST_SELECTORS name
         """
-        self.missing_selectors = []
-        
-        for selector_name, selector in self.SELECTORS.items():
-            # For thumbnails and sizes, check if any elements exist
-            if selector_name in ["thumbnails", "sizes"]:
-                if not soup.select(selector):
-                    self.missing_selectors.append(selector_name)
-            else:
-                if not soup.select_one(selector):
-                    self.missing_selectors.append(selector_name)
+        field_classes = self.CARD_FIELD_CLASSES
+        found: Dict[str, HtmlElement] = {}
+        for element in card.iterdescendants():
+            # Comments and processing instructions have no attributes, so get() gives None
+            for class_name in (element.get("class") or "").split():
+                name = field_classes.get(class_name)
+                if name is not None and name not in found:
+                    found[name] = element
+            if len(found) == len(field_classes):
+                break
+        return found
     
     def scrape_product_detail(self, url: str) -> ProductDetail:
         """
@@ -294,20 +348,34 @@ class NoonProductScraper:
         Raises:
             ValueError: If page fails to load or critical selectors are missing
         """
-        # Reset missing selectors for fresh attempt
-        self.missing_selectors = []
+        cached = self._detail_cache.get(url)
+        if cached is not None:
+            return cached
         
         # Fetch the webpage
-        soup = self.fetch_page(url)
-        if not soup:
+        tree = self.fetch_page(url)
+        if tree is None:
             raise ValueError("Failed to parse the webpage content")
         
-        # Validate selectors
-        self._validate_selectors(soup)
+        # Extract data using selectors
+        product = ProductDetail(
+            image=self._extract_attribute(tree, self.COMPILED_SELECTORS["image"], "src"),
+            title=self._extract_attribute(tree, self.COMPILED_SELECTORS["title"]),
+            offered_price=self._extract_attribute(tree, self.COMPILED_SELECTORS["offered_price"]),
+            original_price=self._extract_attribute(tree, self.COMPILED_SELECTORS["original_price"]),
+            profit=self._extract_attribute(tree, self.COMPILED_SELECTORS["profit"]),
+            description=self._extract_attribute(tree, self.COMPILED_SELECTORS["description"]),
+            thumbnails=self._extract_thumbnails(tree, self.COMPILED_SELECTORS["thumbnails"]),
+            sizes=self._extract_sizes(tree, self.COMPILED_SELECTORS["sizes"]),
+        )
+        
+        # A selector counts as missing when its field came back empty, so a
+        # well-formed page costs no extra selector work to validate
+        missing_selectors = [name for name in self.SELECTORS if not getattr(product, name)]
         
         # Report missing selectors
-        if self.missing_selectors:
-            missing_list = ", ".join(self.missing_selectors)
+        if missing_selectors:
+            missing_list = ", ".join(missing_selectors)
             warning_msg = (
                 f"\n⚠️  WARNING: Missing selectors detected: {missing_list}\n"
                 f"   This could indicate:\n"
@@ -315,20 +383,12 @@ class NoonProductScraper:
                 f"   2. The page structure has changed and the scraper needs to be updated\n"
                 f"   3. The product page is currently unavailable\n"
             )
-            print(warning_msg)
-        
-        # Extract data using selectors
-        product = ProductDetail(
-            image=self._extract_attribute(soup, self.SELECTORS["image"], "src"),
-            title=self._extract_attribute(soup, self.SELECTORS["title"]),
-            offered_price=self._extract_attribute(soup, self.SELECTORS["offered_price"]),
-            original_price=self._extract_attribute(soup, self.SELECTORS["original_price"]),
-            profit=self._extract_attribute(soup, self.SELECTORS["profit"]),
-            description=self._extract_attribute(soup, self.SELECTORS["description"]),
-            thumbnails=self._extract_thumbnails(soup, self.SELECTORS["thumbnails"]),
-            sizes=self._extract_sizes(soup, self.SELECTORS["sizes"]),
-        )
+            logger.warning(warning_msg)
         
+        # Only cache pages that actually yielded product data; a page where every
+        # selector missed is retried on the next scrape instead of being pinned
+        if product.offered_price or product.title:
+            self._detail_cache.put(url, product)
         return product
     
     def scrape_products_from_list(self, url: str, only_deals: bool = True, save_to_file: Optional[str] = None) -> List[ProductCard]:
@@ -344,45 +404,87 @@ class NoonProductScraper:
         Returns:
             List[ProductCard]: List of unique products (no duplicates)
             
+        Raises:
+            ValueError: If page fails to load
+        """
+        products_list = list(self.iter_products_from_list(url, only_deals=only_deals))
+        
+        # Save to file if requested
+        if save_to_file:
+            try:
+                Path(save_to_file).write_bytes(
+                    orjson.dumps([p.to_dict() for p in products_list], option=orjson.OPT_INDENT_2)
+                )
+                logger.info("Saved %d products to %s", len(products_list), save_to_file)
+            except Exception as e:
+                logger.error("Failed to save to file: %s", e)
+        
+        return products_list
+    
+    def iter_products_from_list(self, url: str, only_deals: bool = True) -> Iterator[ProductCard]:
+        """
+        Yield unique products from a category/landing/deals page in page order.
+        
+        Cards are parsed lazily, so a caller that stops consuming early
+        (e.g. via itertools.islice) skips extracting the rest of the page.
+        
+        Args:
+            url (str): The category/landing page URL to scrape
+            only_deals (bool): If True, only yield products with original_price (discounted). 
+                             Default: True (only deals/discounted products)
+            
+        Yields:
+            ProductCard: Each product the first time it is seen
+            
         Raises:
             ValueError: If page fails to load
         """
         # Fetch the webpage
-        soup = self.fetch_page(url)
-        if not soup:
+        tree = self.fetch_page(url)
+        if tree is None:
             raise ValueError("Failed to parse the webpage content")
         
-        products_set: Set[ProductCard] = set()
+        # URLs already yielded; deduplicating on the string avoids building duplicate cards
+        seen_urls: Set[str] = set()
         
         # Find all product cards
-        product_cards = soup.select(self.LIST_SELECTORS["product_card"])
+        product_cards = self.COMPILED_LIST_SELECTORS["product_card"](tree)
         
         if not product_cards:
-            print(f"[WARNING] No product cards found on the page. "
-                  f"This could indicate the selectors need updating or the page structure changed.")
-            return []
+            logger.warning("No product cards found on the page. "
+                           "This could indicate the selectors need updating or the page structure changed.")
+            return
         
         for card in product_cards:
             try:
+                # Locate every sub-field in one pass over the card
+                fields = self._match_card_fields(card)
+                
                 # Extract product URL
-                link_element = card.select_one(self.LIST_SELECTORS["product_link"])
-                if not link_element or not link_element.get("href"):
+                link_element = fields.get("product_link")
+                if link_element is None or not link_element.get("href"):
                     continue
                 
                 product_url = link_element.get("href")
                 # Handle relative URLs
                 if product_url.startswith("/"):
                     product_url = "https://www.noon.com" + product_url
+                if product_url in seen_urls:
+                    continue
                 
                 # Extract title
-                title = self._extract_attribute(card, self.LIST_SELECTORS["product_title"])
+                title_element = fields.get("product_title")
+                title = text_of(title_element) if title_element is not None else None
                 
                 # Extract image (first product image in carousel)
-                image = self._extract_attribute(card, self.LIST_SELECTORS["product_image"], "src")
+                image_element = fields.get("product_image")
+                image = image_element.get("src") if image_element is not None else None
                 
                 # Extract prices
-                offered_price = self._extract_attribute(card, self.LIST_SELECTORS["offered_price"])
-                original_price = self._extract_attribute(card, self.LIST_SELECTORS["original_price"])
+                offered_element = fields.get("offered_price")
+                offered_price = text_of(offered_element) if offered_element is not None else None
+                original_element = fields.get("original_price")
+                original_price = text_of(original_element) if original_element is not None else None
                 
                 # Filter by deals if only_deals is True
                 if only_deals and not original_price:
@@ -397,35 +499,19 @@ class NoonProductScraper:
                     original_price=original_price
                 )
                 
-                # Add to set (duplicates automatically removed)
-                products_set.add(product_card)
+                seen_urls.add(product_url)
                 
             except Exception as e:
                 # Skip products with extraction errors
                 continue
-        
-        # Convert set back to list
-        products_list = list(products_set)
-        
-        # Save to file if requested
-        if save_to_file:
-            try:
-                with open(save_to_file, 'w', encoding='utf-8') as f:
-                    json.dump(
-                        [p.to_dict() for p in products_list],
-                        f,
-                        indent=2,
-                        ensure_ascii=False
-                    )
-                print(f"[OK] Saved {len(products_list)} products to {save_to_file}")
-            except Exception as e:
-                print(f"[ERROR] Failed to save to file: {e}")
-        
-        return products_list
+            
+            yield product_card
 
 
 # Example usage
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.WARNING, format='%(levelname)s %(message)s')
+
     # Initialize the scraper
     scraper = NoonProductScraper()
     
@@ -455,32 +541,41 @@ if __name__ == "__main__":
         
         print(f"[OK] Found {len(products)} products. Checking for deals (profit info)...\n")
         
-        # Scrape details for each product to get profit information
-        deals_with_profit = []
+        # Scrape details for each product concurrently to get profit information
+        details = {}
         
-        for i, product_card in enumerate(products, 1):
-            try:
-                print(f"[{i}/{len(products)}] Scraping: {product_card.title}...", end=" ")
-                product_detail = scraper.scrape_product_detail(product_card.url)
+        with ThreadPoolExecutor(max_workers=scraper.MAX_WORKERS) as executor:
+            futures = {executor.submit(scraper.scrape_product_detail, card.url): card for card in products}
+            for i, future in enumerate(as_completed(futures), 1):
+                product_card = futures[future]
+                try:
+                    product_detail = future.result()
+                except ValueError as e:
+                    print(f"[{i}/{len(products)}] {product_card.title}... ✗ Error: {str(e)[:50]}...")
+                    continue
                 
                 # Check if product has profit (meaning it's on deal)
                 if product_detail.profit:
-                    deals_with_profit.append({
-                        'title': product_detail.title or product_card.title,
-                        'offered_price': product_detail.offered_price or product_card.offered_price,
-                        'original_price': product_detail.original_price or product_card.original_price,
-                        'profit': product_detail.profit,
-                        'description': product_detail.description,
-                        'image': product_detail.image or product_card.image,
-                        'thumbnails': product_detail.thumbnails,
-                        'url': product_card.url
-                    })
-                    print("✓ DEAL FOUND")
+                    details[product_card.url] = product_detail
+                    print(f"[{i}/{len(products)}] {product_card.title}... ✓ DEAL FOUND")
                 else:
-                    print("✗ No deal")
-            except ValueError as e:
-                print(f"✗ Error: {str(e)[:50]}...")
-                continue
+                    print(f"[{i}/{len(products)}] {product_card.title}... ✗ No deal")
+        
+        # Report deals in page order rather than completion order
+        deals_with_profit = []
+        for product_card in products:
+            product_detail = details.get(product_card.url)
+            if product_detail:
+                deals_with_profit.append({
+                    'title': product_detail.title or product_card.title,
+                    'offered_price': product_detail.offered_price or product_card.offered_price,
+                    'original_price': product_detail.original_price or product_card.original_price,
+                    'profit': product_detail.profit,
+                    'description': product_detail.description,
+                    'image': product_detail.image or product_card.image,
+                    'thumbnails': product_detail.thumbnails,
+                    'url': product_card.url
+                })
         
         # Display results
         print("\n" + "=" * 80)
@@ -497,8 +592,9 @@ if __name__ == "__main__":
             
             # Save results to file
             try:
-                with open("noon_deals.json", 'w', encoding='utf-8') as f:
-                    json.dump(deals_with_profit, f, indent=2, ensure_ascii=False)
+                Path("noon_deals.json").write_bytes(
+                    orjson.dumps(deals_with_profit, option=orjson.OPT_INDENT_2)
+                )
                 print(f"\n[OK] Saved {len(deals_with_profit)} deals to noon_deals.json")
             except Exception as e:
                 print(f"\n[ERROR] Failed to save to file: {e}")
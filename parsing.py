@@ -0,0 +1,42 @@
+from lxml.cssselect import CSSSelector
+from lxml.etree import ParserError
+import lxml.html
+import threading
+
+__all__ = ['ParserError', 'css', 'get_parser', 'parse_html', 'select_one', 'text_of']
+
+# lxml parsers are not thread-safe, so each worker thread keeps its own
+_tls = threading.local()
+
+
+def get_parser() -> lxml.html.HTMLParser:
+    """Return this thread's reusable lxml HTML parser"""
+    parser = getattr(_tls, 'parser', None)
+    if parser is None:
+        parser = lxml.html.HTMLParser(encoding='utf-8', recover=True)
+        _tls.parser = parser
+    return parser
+
+
+def parse_html(content: bytes) -> lxml.html.HtmlElement:
+    """Parse a page's raw bytes with this thread's parser.
+
+    Raises ParserError if the document is empty (e.g. only whitespace or comments).
+    """
+    return lxml.html.fromstring(content, parser=get_parser())
+
+
+def css(selector: str) -> CSSSelector:
+    """Compile a CSS selector with the HTML translator used by HtmlElement.cssselect"""
+    return CSSSelector(selector, translator='html')
+
+
+def select_one(tree, selector: CSSSelector):
+    """Return the first element matching a compiled CSSSelector, or None"""
+    matches = selector(tree)
+    return matches[0] if matches else None
+
+
+def text_of(element) -> str:
+    """Return the stripped text content of an element"""
+    return element.text_content().strip()
@@ -0,0 +1,26 @@
+import threading
+import time
+
+
+class TokenBucket:
+    """Per-host rate limiter allowing `burst` requests at once, refilled at `rate` per second"""
+    
+    def __init__(self, rate, burst):
+        self.rate = rate
+        self.burst = burst
+        self._lock = threading.Lock()
+        self._buckets = {}  # host -> (tokens, last refill time)
+    
+    def acquire(self, host):
+        """Take a token for host, blocking only while its bucket is empty"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                tokens, last = self._buckets.get(host, (self.burst, now))
+                tokens = min(self.burst, tokens + (now - last) * self.rate)
+                if tokens >= 1:
+                    self._buckets[host] = (tokens - 1, now)
+                    return
+                self._buckets[host] = (tokens, now)
+                wait = (1 - tokens) / self.rate
+            time.sleep(wait)